@@ -22,11 +22,13 @@ believes about the scene. Keeping this module slim makes it easy to reason
 about how Blender-side edits diverge from the engine.
 """
 
-from typing import Dict, Iterable, Mapping, Set
+from typing import Dict, FrozenSet, Iterable, Mapping, Optional
 
 cdef str _engine_license_mode = "UNKNOWN"
 
-# Membership snapshot returned by the engine: group name -> set of object names.
+# Membership snapshot returned by the engine: group name -> frozenset of object names.
+# Values are immutable and only replaced when their contents change, so readers can
+# share them without copying.
 cdef dict _group_membership_snapshot = {}
 
 # Flag to indicate if classification is in progress
@@ -80,9 +82,12 @@ def update_group_membership_snapshot(snapshot: Mapping[str, Iterable[str]], *, b
         drop_groups_from_snapshot(list(_group_membership_snapshot.keys()))
         _group_membership_snapshot.clear()
 
+    cdef object previous
     for name, members in snapshot.items():
-        member_set = set(members)
-        _group_membership_snapshot[name] = member_set
+        member_set = frozenset(members)
+        previous = _group_membership_snapshot.get(name)
+        if previous is None or previous != member_set:
+            _group_membership_snapshot[name] = member_set
 
 
 def build_group_membership_snapshot(list full_groups, list group_names) -> dict:
@@ -107,9 +112,18 @@ def build_group_membership_snapshot(list full_groups, list group_names) -> dict:
     return snapshot
 
 
-def get_group_membership_snapshot() -> Dict[str, Set[str]]:
-    """Return a deep copy of the engine membership snapshot."""
-    return {name: set(members) for name, members in _group_membership_snapshot.items()}
+def get_group_membership_snapshot(group_names: Optional[Iterable[str]] = None) -> Dict[str, FrozenSet[str]]:
+    """Return a shallow copy of the engine membership snapshot, limited to group_names when given.
+
+    Member sets are shared frozensets, so callers must treat them as read-only.
+    """
+    if group_names is None:
+        return dict(_group_membership_snapshot)
+    return {
+        name: _group_membership_snapshot[name]
+        for name in group_names
+        if name in _group_membership_snapshot
+    }
 
 
 def drop_groups_from_snapshot(group_names: Iterable[str]) -> None:
@@ -26,7 +26,12 @@ Responsibilities:
 """
 
 import bpy
-from typing import Any, Dict, Iterator, Optional, Set
+from typing import Any, Dict, Iterable, Iterator, Optional, Set
+
+import os
+
+# Mirrors pivot.constants.DEBUG_LOGS; pivot_lib cannot import the add-on package
+_DEBUG = bool(os.environ.get("PIVOT_DEBUG"))
 
 cdef class GroupManager:
     """Manages group collections and their metadata with integrated sync state."""
@@ -97,27 +102,34 @@ cdef class GroupManager:
 
     def iter_group_collections(self) -> Iterator[Any]:
         """Yield all collections that are in the managed collections set."""
+        collections = bpy.data.collections
         for coll_name in self._sync_state:
-            if coll_name in bpy.data.collections:
-                yield bpy.data.collections[coll_name]
+            coll = collections.get(coll_name)
+            if coll is not None:
+                yield coll
 
-    def get_group_membership_snapshot(self) -> Dict[str, Set[str]]:
-        """Return current group memberships from Blender collections."""
+    def get_group_membership_snapshot(self, group_names: Optional[Iterable[str]] = None) -> Dict[str, Set[str]]:
+        """Return current group memberships from Blender collections, limited to group_names when given."""
         snapshot = {}
-        for coll in self.iter_group_collections():
+        if group_names is None:
+            collections = self.iter_group_collections()
+        else:
+            collections = (
+                bpy.data.collections.get(name)
+                for name in group_names
+                if name in self._sync_state
+            )
+        for coll in collections:
+            if coll is None:
+                continue
             objects = getattr(coll, "objects", None) or []
             snapshot[coll.name] = {obj.name for obj in objects}
         return snapshot
 
     def _has_mesh_objects(self, coll: Any) -> bool:
         """Check if the collection or its children contain any mesh objects."""
-        for obj in coll.objects:
-            if obj.type == 'MESH':
-                return True
-        for child in coll.children:
-            if self._has_mesh_objects(child):
-                return True
-        return False
+        return (any(obj.type == 'MESH' for obj in coll.objects)
+                or any(self._has_mesh_objects(child) for child in coll.children))
 
     def update_colors(self) -> None:
         """Update color tags for collections based on sync state."""
@@ -226,8 +238,8 @@ cdef class GroupManager:
     cpdef void drop_groups(self, list group_names):
         """Drop multiple groups from being managed and unsubscribe from name changes."""
         cdef str name
-        print("Dropping groups:")
-        print(group_names)
+        if _DEBUG:
+            print(f"[Pivot] Dropping groups: {group_names}")
         for name in group_names:
             if name in self._sync_state:
                 del self._sync_state[name]
@@ -235,7 +247,8 @@ cdef class GroupManager:
                     del self._last_origin_base_state[name]
                 # Unsubscribe when group is dropped
                 self._unsubscribe_group(name)
-        print("Remaining state",self._sync_state)
+        if _DEBUG:
+            print(f"[Pivot] Remaining sync state: {self._sync_state}")
 
     cpdef bint is_managed_collection(self, str collection_name):
         """Check if the given collection name is managed."""
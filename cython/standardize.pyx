@@ -129,7 +129,14 @@ def _standardize_synced_groups(synced_group_names, surface_contexts):
 
 def standardize_groups(list selected_objects, str origin_method, str surface_context):
     """Pro Edition: Classify selected groups via engine."""
-
+    try:
+        _standardize_groups(selected_objects, origin_method, surface_context)
+    except Exception:
+        # The engine may have reassigned surface types before the failure, so the next sync must reach it
+        get_surface_manager().reset_sync_cache()
+        raise
+
+def _standardize_groups(list selected_objects, str origin_method, str surface_context):
     mesh_groups, full_groups, group_names, total_verts, total_edges, total_objects, pivots, synced_group_names, synced_pivots = selection_utils.aggregate_object_groups(selected_objects)
     core_group_mgr = group_manager.get_group_manager()
     origin_method_is_base = origin_method == "BASE"
@@ -201,7 +208,12 @@ def standardize_groups(list selected_objects, str origin_method, str surface_con
         core_group_mgr.set_groups_synced(all_group_names)
         
         # Pass as parallel lists with verified alignment to avoid swapping
-        get_surface_manager().organize_groups_into_surfaces(all_group_names, surface_types)
+        surface_mgr = get_surface_manager()
+        surface_mgr.organize_groups_into_surfaces(all_group_names, surface_types)
+        # The engine already holds these types, so a follow-up sync of the same map is skipped
+        surface_mgr.record_engine_classifications(all_group_names, surface_types)
+    else:
+        get_surface_manager().record_engine_classifications([], [])
 
 def _get_standardize_results(list objects, str surface_context="AUTO"):
     """
@@ -265,35 +277,46 @@ def _get_standardize_results(list objects, str surface_context="AUTO"):
 
 
 
-def standardize_object_origins(list objects, str origin_method, str surface_context="AUTO"):
-    """Standardize object origins."""
-    mesh_objects, rots, origins, cogs = _get_standardize_results(objects, surface_context)
-    if not mesh_objects:
-        return
-    new_origins = []
+def _chunk_objects(list objects, max_objects):
+    """Split objects into engine-request sized chunks; None keeps them in a single chunk."""
+    if max_objects is None or len(objects) <= max_objects:
+        return [objects]
+    return [objects[i:i + max_objects] for i in range(0, len(objects), max_objects)]
 
-    if (origin_method == "BASE"):
-        new_origins = origins
-    else:
-        new_origins = cogs
 
-    for i, obj in enumerate(mesh_objects):
-        if i < len(origins) and i < len(cogs):
+def standardize_object_origins(list objects, str origin_method, str surface_context="AUTO", max_objects=None):
+    """Standardize object origins, sending at most max_objects per engine request."""
+    cdef list chunk
+    for chunk in _chunk_objects(objects, max_objects):
+        mesh_objects, rots, origins, cogs = _get_standardize_results(chunk, surface_context)
+        if not mesh_objects:
+            continue
+        new_origins = []
+
+        if (origin_method == "BASE"):
+            new_origins = origins
+        else:
+            new_origins = cogs
+
+        for i, obj in enumerate(mesh_objects):
+            if i < len(origins) and i < len(cogs):
 
-            # origin_vector = obj.matrix_world.translation + 
-            set_origin_and_preserve_children(obj, Vector(new_origins[i]))
-            bpy.context.scene.cursor.location = obj.matrix_world.translation
+                # origin_vector = obj.matrix_world.translation + 
+                set_origin_and_preserve_children(obj, Vector(new_origins[i]))
+                bpy.context.scene.cursor.location = obj.matrix_world.translation
     
 
-def standardize_object_rotations(list objects):
-    """Standardize object rotations."""
-    mesh_objects, rots, origins, cogs = _get_standardize_results(objects)
-    if not mesh_objects:
-        return
-    for i, obj in enumerate(mesh_objects):
-        if i < len(rots) and i < len(cogs):
-            rot = rots[i]
-            cog = Vector(cogs[i])
-            rotation_matrix = rot.to_matrix().to_4x4()
-            transform = Matrix.Translation(obj.matrix_world.translation + cog) @ rotation_matrix @ Matrix.Translation(-obj.matrix_world.translation - cog) @ obj.matrix_world
-            obj.matrix_world = transform
\ No newline at end of file
+def standardize_object_rotations(list objects, max_objects=None):
+    """Standardize object rotations, sending at most max_objects per engine request."""
+    cdef list chunk
+    for chunk in _chunk_objects(objects, max_objects):
+        mesh_objects, rots, origins, cogs = _get_standardize_results(chunk)
+        if not mesh_objects:
+            continue
+        for i, obj in enumerate(mesh_objects):
+            if i < len(rots) and i < len(cogs):
+                rot = rots[i]
+                cog = Vector(cogs[i])
+                rotation_matrix = rot.to_matrix().to_4x4()
+                transform = Matrix.Translation(obj.matrix_world.translation + cog) @ rotation_matrix @ Matrix.Translation(-obj.matrix_world.translation - cog) @ obj.matrix_world
+                obj.matrix_world = transform
\ No newline at end of file
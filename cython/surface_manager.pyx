@@ -36,34 +36,94 @@ CLASSIFICATION_ROOT_MARKER_PROP = "pivot_is_classification_root"
 CLASSIFICATION_COLLECTION_PROP = "pivot_surface_type"
 CLASSIFICATION_MARKER_PROP = "pivot_is_classification_collection"
 
+# Bumped whenever collections may have changed, invalidating the cached enforced root
+cdef unsigned long long _collections_version = 0
+
+
+def mark_collections_dirty() -> None:
+    """Record that collections changed so the next root lookup re-runs enforcement."""
+    global _collections_version
+    _collections_version += 1
+
+
+def get_collections_version() -> int:
+    """Return the current collections version counter."""
+    return _collections_version
+
+
+# Surface keys and display-name lookup, resolved once at import
+_SURFACE_KEYS = tuple(classification.SURFACE_TYPE_NAMES.keys())
+_SURFACE_NAME_GET = classification.SURFACE_TYPE_NAMES.get
+_SURFACE_KEY_INT = {key: int(key) for key in _SURFACE_KEYS if key.lstrip("-").isdigit()}
+
 
 cdef class SurfaceManager:
     """Manages surface classification collections and hierarchy."""
 
     cdef object _collection_manager
     cdef object _group_manager
+    cdef object _last_synced_classifications
+    cdef object _enforced_root_name
+    cdef object _enforced_key
+    cdef dict _surface_index_names
 
     def __init__(self) -> None:
         self._collection_manager = get_collection_manager()
         self._group_manager = group_manager.get_group_manager()
-
-    def _get_surface_display_name(self, str surface_key) -> str:
-        """Get the display name for a surface key."""
-        return classification.SURFACE_TYPE_NAMES.get(surface_key, surface_key)
-
-    def _ensure_surface_collections_exist(self, pivot_root) -> None:
-        """Guarantee every known surface collection exists under the pivot root."""
-        for surface_key in classification.SURFACE_TYPE_NAMES:
-            self.get_or_create_surface_collection(pivot_root, surface_key)
+        self._last_synced_classifications = None
+        self._enforced_root_name = None
+        self._enforced_key = None
+        self._surface_index_names = None
+
+    def reset_sync_cache(self) -> None:
+        """Forget the last synced classifications so the next sync always reaches the engine."""
+        self._last_synced_classifications = None
+
+    def record_engine_classifications(self, list group_names, list surface_types) -> None:
+        """Record surface types the engine reported as already applied, so an identical sync is skipped.
+
+        Uses the same group -> int mapping collect_group_classifications() builds.
+        """
+        cdef dict synced = {}
+        is_managed = self._group_manager.is_managed_collection
+        for group_name, surface_type in zip(group_names, surface_types):
+            surface_int = _SURFACE_KEY_INT.get(str(surface_type))
+            if surface_int is not None and is_managed(group_name):
+                synced[group_name] = surface_int
+        self._last_synced_classifications = synced
+
+    def _ensure_surface_collections_exist(self, pivot_root) -> dict:
+        """Guarantee every known surface collection exists under the pivot root.
+
+        Returns the surface index used for the check so callers can reuse it.
+        """
+        cdef dict surface_index = self._build_surface_index(pivot_root)
+        for surface_key in _SURFACE_KEYS:
+            self._resolve_surface_collection(pivot_root, surface_key, surface_index)
+        return surface_index
 
     def _get_and_enforce_root_collection(self):
-        """Find or create the root classification collection and enforce structure."""
-        pivot_root = None
+        """Find or create the root classification collection and enforce structure.
+
+        Enforcement is skipped while collections are unchanged since the last run.
+        Only names are cached and re-resolved here, so no collection reference outlives an undo.
+        """
+        if self._enforced_root_name is not None and self._enforced_key == (_collections_version, len(bpy.data.collections)):
+            pivot_root = bpy.data.collections.get(self._enforced_root_name)
+            if pivot_root is not None and pivot_root.get(CLASSIFICATION_ROOT_MARKER_PROP, False):
+                return pivot_root
+        self._enforced_root_name = None
+        self._surface_index_names = None
+
+        # The root normally keeps its canonical name, so try a direct lookup first
+        pivot_root = bpy.data.collections.get(CLASSIFICATION_ROOT_COLLECTION_NAME)
+        if pivot_root is not None and not pivot_root.get(CLASSIFICATION_ROOT_MARKER_PROP, False):
+            pivot_root = None
         cdef list classification_collections = []
         
-        # Single loop: find root and collect all classification collections
+        # Single loop: collect all classification collections, and find the root only if it was renamed
         for coll in bpy.data.collections:
-            if coll.get(CLASSIFICATION_ROOT_MARKER_PROP, False):
+            if pivot_root is None and coll.get(CLASSIFICATION_ROOT_MARKER_PROP, False):
                 pivot_root = coll
             if coll.get(CLASSIFICATION_MARKER_PROP, False):
                 classification_collections.append(coll)
@@ -74,20 +134,59 @@ cdef class SurfaceManager:
         
         if pivot_root:
             # Enforce structure: Remove classification collections not under the pivot root
-            collections_to_remove = [coll for coll in classification_collections if coll.name not in pivot_root.children]
-            for coll in collections_to_remove:
-                # Unlink from any parents first
+            root_children_names = set(pivot_root.children.keys())
+            collections_to_remove = [coll for coll in classification_collections if coll.name not in root_children_names]
+            if collections_to_remove:
+                # Reverse index of child name -> parents, built in one pass only when there is something to remove
+                parents_by_child = {}
                 for parent in bpy.data.collections:
-                    if coll.name in parent.children:
+                    for child in parent.children:
+                        parents_by_child.setdefault(child.name, []).append(parent)
+
+                for coll in collections_to_remove:
+                    # Unlink from any parents first
+                    for parent in parents_by_child.get(coll.name, ()):
                         parent.children.unlink(coll)
-                # Remove the collection
-                bpy.data.collections.remove(coll)
+                    # Remove the collection
+                    bpy.data.collections.remove(coll)
 
             # Ensure each surface bucket exists so we can reclassify into it
-            self._ensure_surface_collections_exist(pivot_root)
+            surface_index = self._ensure_surface_collections_exist(pivot_root)
+            self._surface_index_names = {surface_key: coll.name for surface_key, coll in surface_index.items()}
+
+            self._enforced_root_name = pivot_root.name
+            self._enforced_key = (_collections_version, len(bpy.data.collections))
         
         return pivot_root
 
+    def _build_surface_index(self, pivot_root) -> dict:
+        """Map surface key -> surface collection for the pivot root's children."""
+        cdef dict surface_index = {}
+        if not pivot_root:
+            return surface_index
+        for coll in pivot_root.children:
+            surface_value = coll.get(CLASSIFICATION_COLLECTION_PROP)
+            if surface_value is not None:
+                # Keep the first match, as the linear search did
+                surface_index.setdefault(surface_value, coll)
+        return surface_index
+
+    def _get_surface_index(self, pivot_root) -> dict:
+        """Resolve the surface index cached during root enforcement, or rebuild it when stale."""
+        cdef dict cached = self._surface_index_names
+        cdef dict surface_index
+        if cached is not None and pivot_root.name == self._enforced_root_name:
+            children = pivot_root.children
+            surface_index = {}
+            for surface_key, coll_name in cached.items():
+                coll = children.get(coll_name)
+                if coll is None or coll.get(CLASSIFICATION_COLLECTION_PROP) != surface_key:
+                    break
+                surface_index[surface_key] = coll
+            else:
+                return surface_index
+        return self._build_surface_index(pivot_root)
+
     def get_or_create_surface_collection(self, pivot_root, str surface_key):
         """Get or create a surface classification collection."""
         if not pivot_root:
@@ -98,7 +197,7 @@ cdef class SurfaceManager:
                 return coll
 
         # Get display name for the collection
-        collection_name = self._get_surface_display_name(surface_key)
+        collection_name = _SURFACE_NAME_GET(surface_key, surface_key)
         
         # Try to reuse existing collection
         existing = bpy.data.collections.get(collection_name)
@@ -122,68 +221,97 @@ cdef class SurfaceManager:
         if not pivot_root:
             return result
 
-        for surface_coll in pivot_root.children:
-            surface_value = surface_coll.get(CLASSIFICATION_COLLECTION_PROP)
-            if surface_value:
-                try:
-                    surface_int = int(surface_value)
-                except (TypeError, ValueError):
-                    continue
+        surface_colls = pivot_root.children
+        if not surface_colls:
+            return result
+
+        is_managed = self._group_manager.is_managed_collection
+        for surface_coll in surface_colls:
+            surface_int = _SURFACE_KEY_INT.get(surface_coll.get(CLASSIFICATION_COLLECTION_PROP))
+            if surface_int is None:
+                continue
 
-                for group_coll in surface_coll.children:
-                    if self._group_manager.is_managed_collection(group_coll.name):
-                        result[group_coll.name] = surface_int
+            for group_coll in surface_coll.children:
+                if is_managed(group_coll.name):
+                    result[group_coll.name] = surface_int
 
         return result
 
     def sync_group_classifications(self, dict group_surface_map) -> bint:
-        """Sync classifications with the engine."""
+        """Sync classifications with the engine, skipping maps identical to the last successful sync."""
+        if group_surface_map == self._last_synced_classifications:
+            return True
         try:
-            return engine.set_surface_types_command(group_surface_map)
+            ok = engine.set_surface_types_command(group_surface_map)
         except RuntimeError:
             return False
-
-    def organize_group_into_surface(self, group_collection, str surface_key, pivot_root) -> None:
-        """Organize a single group collection into the surface hierarchy."""
-        if not pivot_root:
-            return
-        
-        # Mark root as classification root collection
-        pivot_root[CLASSIFICATION_ROOT_MARKER_PROP] = True
-        
-        # Get/create surface collection
-        surface_coll = self.get_or_create_surface_collection(pivot_root, surface_key)
-        if not surface_coll:
-            return
-        
-        # Unlink from other surface containers FIRST
-        for other_coll in pivot_root.children:
-            if other_coll is not surface_coll:
-                other_children = getattr(other_coll, "children", None)
-                if other_children and other_children.find(group_collection.name) != -1:
-                    other_children.unlink(group_collection)
-        
-        # Link group to surface collection (only if not already linked)
-        if surface_coll.children.find(group_collection.name) == -1:
-            self._collection_manager.ensure_collection_link(surface_coll, group_collection)
+        if ok:
+            self._last_synced_classifications = dict(group_surface_map)
+        return ok
+
+    def _resolve_surface_collection(self, pivot_root, str surface_key, dict surface_index):
+        """Look up a surface collection in surface_index, creating and indexing it on a miss."""
+        surface_coll = surface_index.get(surface_key) if surface_index is not None else None
+        if surface_coll is None:
+            surface_coll = self.get_or_create_surface_collection(pivot_root, surface_key)
+            if surface_coll and surface_index is not None:
+                surface_index[surface_key] = surface_coll
+        return surface_coll
 
     def organize_groups_into_surfaces(self, list group_names, list surface_types) -> None:
         """Organize multiple group collections into the surface hierarchy using parallel lists."""
         
         # Get and enforce the root collection (includes cleanup)
         pivot_root = self._get_and_enforce_root_collection()
+        if not pivot_root:
+            return
+        
+        # Mark root as classification root collection
+        pivot_root[CLASSIFICATION_ROOT_MARKER_PROP] = True
         
         cdef int idx
         cdef str group_name
         cdef str surface_key
+        cdef dict surface_index = self._get_surface_index(pivot_root)
+        cdef dict buckets = {}
+        cdef list surface_keys = list(map(str, surface_types))
         
+        # Bucket groups by target surface so each surface is processed once
         for idx, group_name in enumerate(group_names):
             group_coll = bpy.data.collections.get(group_name)
             if not group_coll:
                 continue
             
-            surface_key = str(surface_types[idx])
-            self.organize_group_into_surface(group_coll, surface_key, pivot_root)
+            surface_key = surface_keys[idx]
+            buckets.setdefault(surface_key, {})[group_name] = group_coll
+        
+        # Map each group name to the surface containers currently holding it
+        cdef dict surfaces_by_group = {}
+        for other_coll in pivot_root.children:
+            for child in other_coll.children:
+                surfaces_by_group.setdefault(child.name, []).append(other_coll)
+        
+        for surface_key, groups in buckets.items():
+            indexed = surface_key in surface_index
+            surface_coll = self._resolve_surface_collection(pivot_root, surface_key, surface_index)
+            if not surface_coll:
+                continue
+            if not indexed:
+                # A reused collection may already hold groups
+                for child in surface_coll.children:
+                    surfaces_by_group.setdefault(child.name, []).append(surface_coll)
+            
+            for group_name, group_coll in groups.items():
+                current = surfaces_by_group.get(group_name, ())
+                # Unlink from other surface containers FIRST
+                for other_coll in current:
+                    if other_coll is not surface_coll:
+                        other_coll.children.unlink(group_coll)
+                
+                # Link group to surface collection (only if not already linked)
+                if surface_coll not in current:
+                    self._collection_manager.ensure_collection_link(surface_coll, group_coll)
+                surfaces_by_group[group_name] = [surface_coll]
 
     cpdef bint is_classification_collection(self, collection):
         """Check if a collection is a classification collection."""
@@ -198,9 +326,12 @@ cdef class SurfaceManager:
         return collection.get(CLASSIFICATION_ROOT_MARKER_PROP, False)
 
 
-# Global instance
-cdef SurfaceManager _surface_manager = SurfaceManager()
+# Global instance, created on first use
+cdef SurfaceManager _surface_manager = None
 
 def get_surface_manager() -> SurfaceManager:
     """Get the global surface manager instance."""
+    global _surface_manager
+    if _surface_manager is None:
+        _surface_manager = SurfaceManager()
     return _surface_manager
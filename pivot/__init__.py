@@ -20,11 +20,14 @@ import os
 
 
 import elbo_sdk_rust as engine
+from pivot_lib import edition_utils
 from pivot_lib import engine_state
 from .classes import SceneAttributes
+from .constants import DEBUG_LOGS
 from bpy.props import PointerProperty
 
 from pivot_lib import group_manager
+from pivot_lib import surface_manager
 from . import handlers
 from .operators.operators import (
     Pivot_OT_Organize_Classified_Objects,
@@ -50,11 +53,30 @@ classesToRegister = (
     Pivot_OT_Upgrade_To_Pro,
 )
 
+# Panels register after the operators they draw, in sidebar order
+_PANELS = (
+    Pivot_PT_Status_Panel,
+    Pivot_PT_Configuration_Panel,
+    Pivot_PT_Standard_Panel,
+    Pivot_PT_Pro_Panel,
+)
+
+# Persistent handlers as (handler, bpy.app.handlers list name, Pro edition only)
+_HANDLERS = (
+    (handlers.on_load_pre, "load_pre", False),
+    (handlers.on_load_post, "load_post", False),
+    (handlers.on_collections_update, "depsgraph_update_post", False),
+    (handlers.on_depsgraph_update, "depsgraph_update_post", True),
+)
+
+_PKG_DIR = os.path.dirname(__file__)
+
 def _reset_sync_state() -> None:
     """Clear cached engine sync data so reloads start from scratch."""
     group_mgr = group_manager.get_group_manager()
     group_mgr.reset_state()
     engine_state.update_group_membership_snapshot({}, replace=True)
+    surface_manager.get_surface_manager().reset_sync_cache()
     handlers.clear_previous_scales()
 
 
@@ -80,6 +102,16 @@ def _unregister_bpy_class(cls):
         raise
 
 
+def _ensure_handler(handler_list, handler) -> None:
+    if handler not in handler_list:
+        handler_list.append(handler)
+
+
+def _remove_handler(handler_list, handler) -> None:
+    if handler in handler_list:
+        handler_list.remove(handler)
+
+
 def _assign_scene_property() -> None:
     if hasattr(bpy.types.Scene, "pivot"):
         delattr(bpy.types.Scene, "pivot")
@@ -107,25 +139,13 @@ def register():
 
     # Ensure engine binary is executable after zip install (zip extraction often drops exec bits)
     # Keep Blender path/layout knowledge in the bridge; elbo-sdk stays host-agnostic.
-    pivot_dir = os.path.dirname(__file__)
-    bin_dir = os.path.join(pivot_dir, "bin")
+    bin_dir = os.path.join(_PKG_DIR, "bin")
     engine.set_engine_dir(bin_dir)
     engine.start_engine()
 
-    is_pro = False
-    try:
-        # Print Cython edition for debugging
-        try:
-            from pivot_lib import edition_utils
-            edition_utils.print_edition()
-            is_pro = edition_utils.is_pro_edition()
-        except Exception as e:
-            print(f"[Pivot] Could not print Cython edition: {e}")
-            is_pro = False
-    except RuntimeError as exc:
-        print(f"[Pivot] Failed to start engine after loading file: {exc}")
-
-    
+    is_pro = edition_utils.is_pro_edition()
+    if DEBUG_LOGS:
+        edition_utils.print_edition()
 
     # Register name change callback for group management
     try:
@@ -134,24 +154,17 @@ def register():
     except Exception as e:
         print(f"[Pivot] Could not set group name change callback: {e}")
 
-    _register_bpy_class(Pivot_PT_Status_Panel)
-    _register_bpy_class(Pivot_PT_Configuration_Panel)
-
-    # Always register standard panel
-    _register_bpy_class(Pivot_PT_Standard_Panel)
+    for cls in _PANELS:
+        _register_bpy_class(cls)
 
-    _register_bpy_class(Pivot_PT_Pro_Panel)
+    handlers.bind_managers()
 
     # Register persistent handlers for engine lifecycle management
-    if handlers.on_load_pre not in bpy.app.handlers.load_pre:
-        bpy.app.handlers.load_pre.append(handlers.on_load_pre)
-    if handlers.on_load_post not in bpy.app.handlers.load_post:
-        bpy.app.handlers.load_post.append(handlers.on_load_post)
-    
-    # Only register depsgraph update handler for Pro edition
-    if is_pro:
-        if handlers.on_depsgraph_update not in bpy.app.handlers.depsgraph_update_post:
-            bpy.app.handlers.depsgraph_update_post.append(handlers.on_depsgraph_update)
+    # (the main depsgraph update handler is only registered for Pro edition)
+    for handler, list_name, pro_only in _HANDLERS:
+        if pro_only and not is_pro:
+            continue
+        _ensure_handler(getattr(bpy.app.handlers, list_name), handler)
 
     
 
@@ -159,28 +172,22 @@ def register():
 def unregister():
     print("Unregistering Pivot")
     
-    _unregister_bpy_class(Pivot_PT_Pro_Panel)
-    _unregister_bpy_class(Pivot_PT_Standard_Panel)
-    _unregister_bpy_class(Pivot_PT_Status_Panel)
-    _unregister_bpy_class(Pivot_PT_Configuration_Panel)
+    for cls in reversed(_PANELS):
+        _unregister_bpy_class(cls)
     
     for cls in reversed(classesToRegister):  # Unregister in reverse order
         _unregister_bpy_class(cls)
 
     _remove_scene_property()
 
-    # Unregister all persistent handlers
-    if handlers.on_load_pre in bpy.app.handlers.load_pre:
-        bpy.app.handlers.load_pre.remove(handlers.on_load_pre)
-    if handlers.on_load_post in bpy.app.handlers.load_post:
-        bpy.app.handlers.load_post.remove(handlers.on_load_post)
-    # Only remove depsgraph update handler if it's registered (was only added for Pro edition)
-    if handlers.on_depsgraph_update in bpy.app.handlers.depsgraph_update_post:
-        bpy.app.handlers.depsgraph_update_post.remove(handlers.on_depsgraph_update)
+    # Unregister all persistent handlers (Pro-only ones may not have been added)
+    for handler, list_name, _pro_only in _HANDLERS:
+        _remove_handler(getattr(bpy.app.handlers, list_name), handler)
 
     # Perform cleanup as if we're unloading a file
     _reset_sync_state()
     handlers.on_load_pre(None)
+    handlers.unbind_managers()
     engine.stop_engine()
 
 
@@ -22,6 +22,7 @@ import bpy
 
 # Import C enum values from Cython module
 from pivot_lib import classification
+from pivot_lib.surface_manager import CLASSIFICATION_MARKER_PROP, CLASSIFICATION_ROOT_MARKER_PROP, get_collections_version
 from .constants import LICENSE_STANDARD, LICENSE_PRO
 
 # UI Labels (property names derived from these)
@@ -32,29 +33,61 @@ LABEL_SURFACE_CONTEXT = "Surface Context:"
 LABEL_ORIGIN_METHOD = "Origin Method:"
 LABEL_LICENSE_TYPE = "License:"
 
-# Marker property to identify classification collections
-CLASSIFICATION_MARKER_PROP = "pivot_is_classification_collection"
-CLASSIFICATION_ROOT_MARKER_PROP = "pivot_is_classification_root"
+# Per-collection descendant results for the collection poll, valid while the key below is unchanged
+_descendant_cache = {}
+_descendant_cache_key = None
+# Collection name -> parent collection names, and the names of classification collections.
+# Built on first use per cache key; names only, so no collection references outlive an undo.
+_collection_parents = None
+_classification_names = None
+
+def _build_collection_parents():
+    """Index every collection's parents and the classification collections in one pass."""
+    global _collection_parents, _classification_names
+    parents = {}
+    marked = set()
+    for parent_coll in bpy.data.collections:
+        parent_name = parent_coll.name
+        if parent_coll.get(CLASSIFICATION_MARKER_PROP, False) or parent_coll.get(CLASSIFICATION_ROOT_MARKER_PROP, False):
+            marked.add(parent_name)
+        for child in parent_coll.children:
+            parents.setdefault(child.name, []).append(parent_name)
+    _collection_parents = parents
+    _classification_names = marked
 
 def _is_descendant_of_classification_collection(coll):
     """Check if a collection is a descendant of any classification collection."""
-    def check_parents(current_coll):
-        for parent_coll in bpy.data.collections:
-            if parent_coll.get(CLASSIFICATION_MARKER_PROP, False) or parent_coll.get(CLASSIFICATION_ROOT_MARKER_PROP, False):
-                if _is_in_subtree(current_coll, parent_coll):
-                    return True
+    if _collection_parents is None:
+        _build_collection_parents()
+    if not _classification_names:
         return False
-    
-    def _is_in_subtree(target_coll, root_coll):
-        """Check if target_coll is in the subtree of root_coll."""
-        if target_coll == root_coll:
+    # Walk up through every parent chain; a collection can be linked under several parents
+    stack = [coll.name]
+    seen = set(stack)
+    while stack:
+        name = stack.pop()
+        if name in _classification_names:
             return True
-        for child in root_coll.children:
-            if _is_in_subtree(target_coll, child):
-                return True
-        return False
-    
-    return check_parents(coll)
+        for parent_name in _collection_parents.get(name, ()):
+            if parent_name not in seen:
+                seen.add(parent_name)
+                stack.append(parent_name)
+    return False
+
+def _is_descendant_cached(coll):
+    """Memoized _is_descendant_of_classification_collection for repeated poll calls."""
+    global _descendant_cache_key, _collection_parents
+    key = (get_collections_version(), len(bpy.data.collections))
+    if key != _descendant_cache_key:
+        _descendant_cache.clear()
+        _collection_parents = None
+        _descendant_cache_key = key
+    name = coll.name
+    result = _descendant_cache.get(name)
+    if result is None:
+        result = _is_descendant_of_classification_collection(coll)
+        _descendant_cache[name] = result
+    return result
 
 def poll_visible_collections(self, coll):
     """
@@ -67,7 +100,7 @@ def poll_visible_collections(self, coll):
         return False
     
     # Check if this collection is a descendant of any classification collection
-    if _is_descendant_of_classification_collection(coll):
+    if _is_descendant_cached(coll):
         return False
     
     return True
@@ -32,50 +32,62 @@ def get_all_mesh_objects_in_collection(coll):
 
 def build_collection_caches(scene_root):
     coll_to_top = {}
+    root_markers = set()
+    tops = []
 
     def traverse(current_coll, current_top):
         for child in current_coll.children:
             coll_to_top[child] = current_top
             traverse(child, current_top)
 
+    # Only map the direct children up front; nested collections are resolved on first miss
     for top in scene_root.children:
         if top.get(CLASSIFICATION_ROOT_MARKER_PROP, False):
+            root_markers.add(top)
             continue
         coll_to_top[top] = top
-        traverse(top, top)
+        tops.append(top)
+
+    traversed = False
+
+    def top_for_collection(coll):
+        nonlocal traversed
+        top = coll_to_top.get(coll)
+        if top is None and not traversed:
+            traversed = True
+            for top in tops:
+                coll_to_top[top] = top
+                traverse(top, top)
+            top = coll_to_top.get(coll)
+        return top
 
     top_has_mesh_cache = {}
 
     def coll_has_mesh(coll):
-        for o in coll.objects:
-            if o.type == 'MESH':
-                return True
-        for child in coll.children:
-            if coll_has_mesh(child):
-                return True
-        return False
+        return (any(o.type == 'MESH' for o in coll.objects)
+                or any(coll_has_mesh(child) for child in coll.children))
 
-    return coll_to_top, top_has_mesh_cache, coll_has_mesh
+    return top_for_collection, root_markers, top_has_mesh_cache, coll_has_mesh
 
 
-def object_qualifies(obj, scene_root, coll_to_top, top_has_mesh_cache, coll_has_mesh):
-    if obj.type == 'MESH' and scene_root in obj.users_collection:
+def object_qualifies(obj, scene_root, top_for_collection, root_markers, top_has_mesh_cache, coll_has_mesh, users_collection=None):
+    # users_collection scans every collection in the file, so read it once (callers may pass it in)
+    if users_collection is None:
+        users_collection = obj.users_collection
+    if obj.type == 'MESH' and scene_root in users_collection:
         return True
 
     def has_mesh_descendants(obj):
-        for child in obj.children:
-            if child.type == 'MESH' or has_mesh_descendants(child):
-                return True
-        return False
+        return any(child.type == 'MESH' or has_mesh_descendants(child) for child in obj.children)
 
-    if scene_root in obj.users_collection and has_mesh_descendants(obj):
+    if scene_root in users_collection and has_mesh_descendants(obj):
         return True
 
-    for coll in getattr(obj, 'users_collection', []) or []:
+    for coll in users_collection:
         if coll is scene_root:
             continue
-        top = coll_to_top.get(coll)
-        if not top or top.get(CLASSIFICATION_ROOT_MARKER_PROP, False):
+        top = top_for_collection(coll)
+        if not top or top in root_markers:
             continue
         if top not in top_has_mesh_cache:
             top_has_mesh_cache[top] = coll_has_mesh(top)
@@ -90,23 +102,35 @@ def selected_has_qualifying_objects(selected_objects, objects_collection):
     if not scene_root or not selected_objects:
         return False
 
-    coll_to_top, top_has_mesh_cache, coll_has_mesh = build_collection_caches(scene_root)
-
+    # Read each object's collections once and reuse them for ordering and qualification
+    candidates = []
     for obj in selected_objects:
-        if obj and object_qualifies(obj, scene_root, coll_to_top, top_has_mesh_cache, coll_has_mesh):
+        if not obj:
+            continue
+        users_collection = obj.users_collection
+        # Meshes linked directly to the root qualify without walking the collection tree
+        if obj.type == 'MESH' and scene_root in users_collection:
             return True
+        candidates.append((obj, users_collection))
 
-    return False
+    # Objects with fewer collection links resolve fastest, so test them first
+    candidates.sort(key=lambda candidate: len(candidate[1]))
+
+    caches = build_collection_caches(scene_root)
+    return any(
+        object_qualifies(obj, scene_root, *caches, users_collection=users_collection)
+        for obj, users_collection in candidates
+    )
 
 
 def get_qualifying_objects_for_selected(selected_objects, objects_collection):
     qualifying = []
     scene_root = objects_collection
 
-    coll_to_top, top_has_mesh_cache, coll_has_mesh = build_collection_caches(scene_root)
+    top_for_collection, root_markers, top_has_mesh_cache, coll_has_mesh = build_collection_caches(scene_root)
 
     for obj in selected_objects:
-        if object_qualifies(obj, scene_root, coll_to_top, top_has_mesh_cache, coll_has_mesh):
+        if object_qualifies(obj, scene_root, top_for_collection, root_markers, top_has_mesh_cache, coll_has_mesh):
             qualifying.append(obj)
 
     return list(set(qualifying))  # remove duplicates
\ No newline at end of file
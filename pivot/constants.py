@@ -15,6 +15,8 @@
 # You should have received a copy of the GNU General Public License
 # along with this program; if not, see <https://www.gnu.org/licenses>.
 
+import os
+
 PRE = "LBO_PIVOT"
 CATEGORY = "Pivot"
 
@@ -54,3 +56,9 @@ EDIT = "EDIT"
 INFO = "INFO"
 WARNING = "WARNING"
 ERROR = "ERROR"
+
+# Debugging switches, read from the environment once at import so hot paths only test a bool
+# Verbose console logging
+DEBUG_LOGS = bool(os.environ.get("PIVOT_DEBUG"))
+# Operator and handler timing output
+DEBUG_TIMINGS = bool(os.environ.get("PIVOT_DEBUG_TIMINGS"))
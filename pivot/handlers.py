@@ -23,9 +23,6 @@
 
 import bpy
 from bpy.app.handlers import persistent
-import os
-import sys
-import stat
 
 from pivot_lib import engine_state
 from pivot_lib import group_manager
@@ -33,34 +30,105 @@ import elbo_sdk_rust as engine
 from pivot_lib import surface_manager
 import time
 
-# Cache of each object's last-known scale to detect transform-only edits quickly.
-_previous_scales: dict[str, tuple[float, float, float]] = {}
-# Cache of each object's last-known rotation to detect rotation changes.
-_previous_rotations: dict[str, tuple[float, float, float, float]] = {}
+from .constants import DEBUG_LOGS, DEBUG_TIMINGS
+
+# Cache of each object's last-known scale to detect transform-only edits quickly, keyed by as_pointer().
+_previous_scales: dict[int, tuple[float, float, float]] = {}
+# Cache of each object's last-known rotation to detect rotation changes, keyed by as_pointer().
+_previous_rotations: dict[int, tuple[float, float, float, float]] = {}
+# The caches are pruned of deleted objects once every this many cache updates.
+_CACHE_PRUNE_INTERVAL = 100
+_cache_updates_since_prune = 0
+
+# Shared stand-in for groups missing from the current snapshot, so lookups don't allocate.
+_NO_MEMBERS = frozenset()
+
+# Group manager singleton used by the depsgraph passes, bound at register time by bind_managers().
+_group_mgr = None
+
+
+def bind_managers():
+    """Bind the manager singletons used on the depsgraph hot path."""
+    global _group_mgr
+    _group_mgr = group_manager.get_group_manager()
+
+
+def unbind_managers():
+    """Release the manager references bound by bind_managers()."""
+    global _group_mgr
+    _group_mgr = None
+
+
+@persistent
+def on_collections_update(scene, depsgraph):
+    """Invalidate collection-derived caches when any collection changes.
+
+    Registered in every edition: root enforcement and the collection poll cache rely on
+    the version counter, while on_depsgraph_update is Pro-only.
+    """
+    if depsgraph.id_type_updated('COLLECTION'):
+        surface_manager.mark_collections_dirty()
 
 
 @persistent
 def on_depsgraph_update(scene, depsgraph):
     """Orchestrate all depsgraph update handlers in guaranteed order."""
-    start_time = time.time()
+    if DEBUG_TIMINGS:
+        start_time = time.perf_counter()
+    collections_updated = depsgraph.id_type_updated('COLLECTION')
+    objects_updated = depsgraph.id_type_updated('OBJECT') or depsgraph.id_type_updated('MESH')
     if engine_state.is_performing_classification():
         engine_state.set_performing_classification(False)
-    else:
-        detect_collection_hierarchy_changes(scene, depsgraph)
-        unsync_mesh_changes(scene, depsgraph)
-    enforce_colors(scene, depsgraph)
-    end_time = time.time()
-    # print(f"on_depsgraph_update took {1000 * (end_time - start_time):.4f} milliseconds")
-
-
-def detect_collection_hierarchy_changes(scene, depsgraph):
+    elif objects_updated or collections_updated:
+        # Membership edits can involve groups that never appear in depsgraph.updates (e.g. an object moved
+        # out of a collection excluded from the view layer), so compare every managed group when collections
+        # changed. Object-only ticks cannot change membership and only need the groups they touched.
+        touched_groups = None if collections_updated else _collect_touched_groups(depsgraph)
+        if touched_groups is None or touched_groups:
+            # Build both membership snapshots once and share them between the passes
+            current_snapshot = _group_mgr.get_group_membership_snapshot(touched_groups)
+            expected_snapshot = engine_state.get_group_membership_snapshot(touched_groups)
+            detect_collection_hierarchy_changes(scene, depsgraph, current_snapshot, expected_snapshot)
+            if objects_updated:
+                unsync_mesh_changes(scene, depsgraph, current_snapshot, expected_snapshot)
+    # Orphan detection also depends on the scene's Source Collection, which only tags the SCENE ID.
+    # Ticks that touch none of these (materials, UI, etc.) cannot change group state.
+    if objects_updated or collections_updated or depsgraph.id_type_updated('SCENE'):
+        enforce_colors(scene, depsgraph)
+    if DEBUG_TIMINGS:
+        end_time = time.perf_counter()
+        print(f"on_depsgraph_update took {1000 * (end_time - start_time):.4f} milliseconds")
+
+
+def _collect_touched_groups(depsgraph):
+    """Return names of managed groups holding an object updated this tick.
+
+    Only used on ticks without collection updates: membership is unchanged then, so only
+    these groups can have changed transforms or geometry. Updated IDs are matched by pointer
+    against the groups' objects, as unsync_mesh_changes matches them, avoiding per-object
+    users_collection scans.
+    Renamed or deleted group collections are dropped as orphans by enforce_colors.
+    """
+    Object = bpy.types.Object
+    object_ptrs = set()
+    for update in depsgraph.updates:
+        id_orig = update.id.original
+        if isinstance(id_orig, Object):
+            object_ptrs.add(id_orig.as_pointer())
+    touched_groups = set()
+    if not object_ptrs:
+        return touched_groups
+    for coll in _group_mgr.iter_group_collections():
+        if any(obj.as_pointer() in object_ptrs for obj in coll.objects):
+            touched_groups.add(coll.name)
+    return touched_groups
+
+
+def detect_collection_hierarchy_changes(scene, depsgraph, current_snapshot, expected_snapshot):
     """Detect changes in collection hierarchy and mark affected groups as out-of-sync with the engine."""
-    group_mgr = group_manager.get_group_manager()
-    
-    current_snapshot = group_mgr.get_group_membership_snapshot()
-    expected_snapshot = engine_state.get_group_membership_snapshot()
+    group_mgr = _group_mgr
     for group_name, expected_members in expected_snapshot.items():
-        current_members = current_snapshot.get(group_name, set())
+        current_members = current_snapshot.get(group_name, _NO_MEMBERS)
         if expected_members != current_members:
             group_mgr.set_group_unsynced(group_name)
 
@@ -71,7 +139,7 @@ def enforce_colors(scene, depsgraph):
     Also immediately handles orphaned groups by dropping them from engine,
     sync state, and clearing their colors.
     """
-    group_mgr = group_manager.get_group_manager()
+    group_mgr = _group_mgr
     orphaned_groups = group_mgr.update_orphaned_groups()
     
     # Immediately handle orphaned groups
@@ -81,11 +149,14 @@ def enforce_colors(scene, depsgraph):
             dropped_count = engine.drop_groups_command(orphaned_groups)
             if dropped_count >= 0:
                 # Clear their colors and remove from sync state
+                collections = bpy.data.collections
                 for coll_name in orphaned_groups:
-                    if coll_name in bpy.data.collections:
-                        bpy.data.collections[coll_name].color_tag = 'NONE'
+                    coll = collections.get(coll_name)
+                    if coll is not None and coll.color_tag != 'NONE':
+                        coll.color_tag = 'NONE'
                 group_mgr.drop_groups(orphaned_groups)
-                print(f"[Pivot] Dropped {dropped_count} orphaned groups from engine")
+                if DEBUG_LOGS:
+                    print(f"[Pivot] Dropped {dropped_count} orphaned groups from engine")
         except Exception as e:
             print(f"[Pivot] Error handling orphaned groups: {e}")
     
@@ -93,78 +164,77 @@ def enforce_colors(scene, depsgraph):
     group_mgr.update_colors()
 
 
-def unsync_mesh_changes(scene, depsgraph):
-    """Detect mesh and transform changes on selected objects and mark groups as unsynced."""
-    global _previous_scales, _previous_rotations
+def unsync_mesh_changes(scene, depsgraph, current_snapshot, expected_snapshot):
+    """Detect mesh and transform changes on selected objects and mark groups as unsynced.
+
+    The snapshots cover the groups touched by this update, as built by on_depsgraph_update.
+    """
+    global _previous_scales, _previous_rotations, _cache_updates_since_prune
     
-    group_mgr = group_manager.get_group_manager()
+    group_mgr = _group_mgr
 
-    # Get all selected mesh objects first (quick operation)
-    all_selected_mesh = [obj for obj in bpy.context.selected_objects if obj.type == 'MESH']
-    all_selected_mesh_set = set(all_selected_mesh)  # For O(1) lookup
+    # Get pointers of all selected mesh objects first (quick operation, O(1) lookups)
+    selected_ptrs = {obj.as_pointer() for obj in bpy.context.selected_objects if obj.type == 'MESH'}
     
-    if not all_selected_mesh:
+    if not selected_ptrs:
         return  # No selected objects, nothing to do
     
     # Get managed collections info (fast, no full snapshot yet)
     managed_group_names = group_mgr.get_sync_state_keys()  # Returns a set
     
-    selected_objects = []
+    # Selected object -> managed group names; insertion order doubles as the deduplicated selection
     obj_to_groups = {}
+    # Reverse lookup for O(1) matching: update.id.original pointer -> obj.
+    # Keyed by as_pointer() because id() of bpy wrappers is not stable across accesses.
+    ptr_to_obj = {}
     
-    # Iterate managed collections to find selected objects (avoids checking all 220 objects)
+    # Iterate managed collections to find selected objects (avoids checking every object in the scene)
     for group_name in managed_group_names:
         # Get the collection
         coll = bpy.data.collections.get(group_name)
         if not coll:
             continue
         
-        # Check only objects in this collection against selected set (O(1) lookups)
         for obj in coll.objects:
-            if obj in all_selected_mesh_set:
-                if obj not in selected_objects:
-                    selected_objects.append(obj)
-                if obj not in obj_to_groups:
-                    obj_to_groups[obj] = []
-                obj_to_groups[obj].append(group_name)
-    
-    if not selected_objects:
-        return  # No selected objects in managed collections
+            ptr = obj.as_pointer()
+            if ptr not in selected_ptrs:
+                continue
+            groups = obj_to_groups.get(obj)
+            if groups is None:
+                groups = obj_to_groups[obj] = []
+                ptr_to_obj[ptr] = obj
+                ptr_to_obj[obj.data.as_pointer()] = obj
+            groups.append(group_name)
     
-    # Only build snapshots if we have selected objects to process
-    expected_snapshot = engine_state.get_group_membership_snapshot()
-    current_snapshot = group_mgr.get_group_membership_snapshot()
+    if not obj_to_groups:
+        return  # No selected objects in managed collections
     
-    # Build reverse lookup for O(1) matching: update.id.original -> obj
-    id_to_obj = {}
-    for obj in selected_objects:
-        id_to_obj[id(obj)] = obj
-        id_to_obj[id(obj.data)] = obj
-
     # Main processing loop
     for update in depsgraph.updates:
         if not (update.is_updated_geometry or update.is_updated_transform):
             continue
 
         # O(1) lookup instead of O(m) loop
-        obj = id_to_obj.get(id(update.id.original))
+        obj = ptr_to_obj.get(update.id.original.as_pointer())
         if obj is None:
             continue
 
+        obj_ptr = obj.as_pointer()
+
+        current_scale = tuple(obj.scale)
+        prev_scale = _previous_scales.get(obj_ptr)
+        scale_changed = prev_scale is not None and current_scale != prev_scale
+
+        current_rotation = tuple(obj.rotation_quaternion)
+        prev_rotation = _previous_rotations.get(obj_ptr)
+        rotation_changed = prev_rotation is not None and current_rotation != prev_rotation
+
         group_names = obj_to_groups.get(obj, [])
         for group_name in group_names:
             expected_members = expected_snapshot.get(group_name)
-            current_members = current_snapshot.get(group_name, set())
+            current_members = current_snapshot.get(group_name, _NO_MEMBERS)
             member_count = len(expected_members) if expected_members is not None else len(current_members)
 
-            current_scale = tuple(obj.scale)
-            prev_scale = _previous_scales.get(obj.name)
-            scale_changed = prev_scale is not None and current_scale != prev_scale
-
-            current_rotation = tuple(obj.rotation_quaternion)
-            prev_rotation = _previous_rotations.get(obj.name)
-            rotation_changed = prev_rotation is not None and current_rotation != prev_rotation
-
             should_mark_unsynced = (
                 expected_members is None
                 or update.is_updated_geometry
@@ -177,8 +247,22 @@ def unsync_mesh_changes(scene, depsgraph):
                 group_mgr.set_group_unsynced(group_name)
 
         # Update scale and rotation caches for next handler invocation
-        _previous_scales[obj.name] = current_scale
-        _previous_rotations[obj.name] = current_rotation
+        _previous_scales[obj_ptr] = current_scale
+        _previous_rotations[obj_ptr] = current_rotation
+
+    _cache_updates_since_prune += 1
+    if _cache_updates_since_prune >= _CACHE_PRUNE_INTERVAL:
+        _cache_updates_since_prune = 0
+        _prune_transform_caches()
+
+
+def _prune_transform_caches():
+    """Drop cached transforms of objects that no longer exist."""
+    live_ptrs = {obj.as_pointer() for obj in bpy.data.objects}
+    for cache in (_previous_scales, _previous_rotations):
+        for ptr in [ptr for ptr in cache if ptr not in live_ptrs]:
+            del cache[ptr]
+
 
 def clear_previous_scales():
     """Clear the scale and rotation caches used for detecting transform changes."""
@@ -199,7 +283,7 @@ def on_group_name_changed(collection, group_mgr):
     old_name = name_tracker.get(collection)
     new_name = collection.name
 
-    if old_name and old_name != new_name:
+    if old_name and old_name != new_name and collection.color_tag != 'NONE':
         # Mark the collection as orphaned - enforce_colors will handle cleanup
         collection.color_tag = 'NONE'
 
@@ -238,6 +322,8 @@ def on_load_post(scene):
     
     # Initialize engine state for the new scene
     engine_state.update_group_membership_snapshot({}, replace=True)
+    surface_manager.get_surface_manager().reset_sync_cache()
+    surface_manager.mark_collections_dirty()
     clear_previous_scales()
 
     engine.start_engine()
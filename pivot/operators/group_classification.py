@@ -18,7 +18,7 @@
 import bpy
 import time
 
-from ..constants import PRE, FINISHED
+from ..constants import PRE, FINISHED, DEBUG_TIMINGS
 from pivot_lib import standardize
 from pivot_lib import group_manager
 from pivot_lib import engine_state
@@ -34,7 +34,6 @@ class Pivot_OT_Standardize_Selected_Groups(bpy.types.Operator):
     """
     bl_idname = "object." + PRE.lower() + "standardize_selected_groups"
     bl_icon = 'OUTLINER_COLLECTION'
-    license_type = engine_state.get_engine_license_status()
     bl_label = "Standardize & Classify Selected Assets"
     bl_description = "Analyzes the selection to identify asset hierarchies (parenting/collection-based) in the Source Collection. Runs the full standardization and classification process on each group, then creates a new, perfectly organized Outliner structure. This is the main 'processing' step for your scene"
     bl_options = {"REGISTER", "UNDO"}
@@ -48,10 +47,11 @@ class Pivot_OT_Standardize_Selected_Groups(bpy.types.Operator):
 
     def execute(self, context):
         # Exit edit mode if active to ensure mesh data is accessible
-        if bpy.context.mode == 'EDIT_MESH':
+        if context.mode == 'EDIT_MESH':
             bpy.ops.object.mode_set(mode='OBJECT')
         
-        startTime = time.perf_counter()
+        if DEBUG_TIMINGS:
+            startTime = time.perf_counter()
         
         objects_collection = group_manager.get_group_manager().get_objects_collection()
         objects = get_qualifying_objects_for_selected(context.selected_objects, objects_collection)
@@ -64,8 +64,9 @@ class Pivot_OT_Standardize_Selected_Groups(bpy.types.Operator):
             surface_context=surface_type
         )
         
-        endTime = time.perf_counter()
-        elapsed = endTime - startTime
-        print(f"Standardize Selected Groups completed in {(elapsed) * 1000:.2f}ms")
+        if DEBUG_TIMINGS:
+            endTime = time.perf_counter()
+            elapsed = endTime - startTime
+            print(f"Standardize Selected Groups completed in {(elapsed) * 1000:.2f}ms")
         engine_state.set_performing_classification(True)
         return {FINISHED}
\ No newline at end of file
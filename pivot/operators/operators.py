@@ -18,26 +18,27 @@
 import json
 import bpy
 import time
-
-from mathutils import Vector
+from itertools import chain
 
 from pivot_lib import engine_state
 # import elbo_sdk_rust as engine
 from ..constants import (
     CANCELLED,
+    DEBUG_TIMINGS,
     FINISHED,
     LICENSE_PRO,
     PRE,
 )
 
 from pivot_lib import group_manager
+from pivot_lib import standardize
 from pivot_lib import surface_manager
+from pivot_lib.surface_manager import CLASSIFICATION_MARKER_PROP, CLASSIFICATION_ROOT_MARKER_PROP
 
 import elbo_sdk_rust as engine
 
 class Pivot_OT_Organize_Classified_Objects(bpy.types.Operator):
     bl_idname = "object." + PRE.lower() + "organize_classified_objects"
-    license_type = engine_state.get_engine_license_status()
     bl_label = "Arrange Viewport by Collection"
     bl_description = "Arranges all standardized objects found in the Source Collection into clean rows grouped by class. Note: This operation ignores your current selection"
     bl_options = {"REGISTER", "UNDO"}
@@ -49,21 +50,20 @@ class Pivot_OT_Organize_Classified_Objects(bpy.types.Operator):
         return group_mgr.has_existing_groups()
 
     def execute(self, context):
-        start_total = time.perf_counter()
+        if DEBUG_TIMINGS:
+            start_total = time.perf_counter()
         try:
-            from pivot_lib import standardize
-            
             # First, standardize all managed groups
             group_mgr = group_manager.get_group_manager()
-            managed_groups = list(group_mgr.get_managed_group_names_set())
+            managed_groups = group_mgr.get_managed_group_names_set()
             
             if managed_groups:
                 # Collect all objects from managed groups to standardize them
-                objects_to_standardize = []
-                for group_name in managed_groups:
-                    if group_name in bpy.data.collections:
-                        group_coll = bpy.data.collections[group_name]
-                        objects_to_standardize.extend(list(group_coll.objects))
+                colls = bpy.data.collections
+                group_colls = (colls.get(group_name) for group_name in managed_groups)
+                objects_to_standardize = list(chain.from_iterable(
+                    group_coll.objects for group_coll in group_colls if group_coll is not None
+                ))
                 
                 if objects_to_standardize:
                     try:
@@ -84,55 +84,61 @@ class Pivot_OT_Organize_Classified_Objects(bpy.types.Operator):
                     self.report({"WARNING"}, "Failed to sync classifications to engine; results may be outdated")
 
             # Call the engine to organize objects
-            start_engine = time.perf_counter()
+            if DEBUG_TIMINGS:
+                start_engine = time.perf_counter()
             
             response = json.loads(engine.organize_objects_command())
-            end_engine = time.perf_counter()
-            
-            start_post = time.perf_counter()
+            if DEBUG_TIMINGS:
+                end_engine = time.perf_counter()
+                start_post = time.perf_counter()
             if "positions" in response:
                 positions = response["positions"]
                 
                 # Apply positions to each group using collection-based tracking
                 organized_count = 0
-                for group_name, pos in positions.items():
-                    if group_name not in bpy.data.collections:
+                targets = []
+                target_append = targets.append
+                colls = bpy.data.collections
+                # Resolve which returned groups still exist in one set intersection
+                for group_name in positions.keys() & set(colls.keys()):
+                    pos = positions[group_name]
+                    objects_in_group = colls[group_name].objects
+                    if not objects_in_group:
                         continue
                     
-                    objects_in_group = bpy.data.collections[group_name].objects
-                    if not objects_in_group:
+                    if not isinstance(pos, (list, tuple)) or len(pos) != 3:
+                        print(f"[Pivot] Failed to organize group '{group_name}': invalid position {pos!r}")
                         continue
                     
-                    try:
-                        target_pos = Vector((pos[0], pos[1], pos[2]))
-                        
-                        # Move only parent objects in the group directly to the engine-provided position
-                        parent_objs = [obj for obj in objects_in_group if obj.parent is None]
-                        if not parent_objs:
-                            continue
-
-                        for obj in parent_objs:
-                            obj.location = target_pos.copy()
-                        
+                    # Gather only parent objects in the group; they move directly to the engine-provided position
+                    count_before = len(targets)
+                    for obj in objects_in_group:
+                        if obj.parent is None:
+                            target_append((obj, pos))
+                    if len(targets) != count_before:
                         organized_count += 1
-                    except Exception as e:
-                        print(f"[Pivot] Failed to organize group '{group_name}': {e}")
-                        # Continue to next group instead of failing the whole operation
+                
+                # Location accepts any 3-sequence, so assign the engine values as-is in one pass
+                for obj, pos in targets:
+                    obj.location = pos
                 
                 self.report({"INFO"}, f"Organized {organized_count} object groups")
                 engine_state.set_performing_classification(True)
             else:
                 self.report({"WARNING"}, "No positions returned from engine")
-            end_post = time.perf_counter()
+            if DEBUG_TIMINGS:
+                end_post = time.perf_counter()
                 
         except Exception as e:
-            end_total = time.perf_counter()
             self.report({"ERROR"}, f"Failed to organize objects: {e}")
-            print(f"Organize objects failed - Total time: {(end_total - start_total) * 1000:.2f}ms")
+            if DEBUG_TIMINGS:
+                end_total = time.perf_counter()
+                print(f"Organize objects failed - Total time: {(end_total - start_total) * 1000:.2f}ms")
             return {CANCELLED}
         
-        end_total = time.perf_counter()
-        print(f"Organize objects - Engine call: {(end_engine - start_engine) * 1000:.2f}ms, Post-processing: {(end_post - start_post) * 1000:.2f}ms, Total: {(end_total - start_total) * 1000:.2f}ms")
+        if DEBUG_TIMINGS:
+            end_total = time.perf_counter()
+            print(f"Organize objects - Engine call: {(end_engine - start_engine) * 1000:.2f}ms, Post-processing: {(end_post - start_post) * 1000:.2f}ms, Total: {(end_total - start_total) * 1000:.2f}ms")
             
         return {FINISHED}
 
@@ -145,8 +151,6 @@ class Pivot_OT_Reset_Classifications(bpy.types.Operator):
 
     def execute(self, context):
         try:
-            from ..classes import CLASSIFICATION_ROOT_MARKER_PROP, CLASSIFICATION_MARKER_PROP
-            
             # Find and delete all classification collections
             collections_to_delete = []
             
@@ -157,10 +161,10 @@ class Pivot_OT_Reset_Classifications(bpy.types.Operator):
             
             # Delete found collections
             deleted_count = 0
+            scene = context.scene
             for coll in collections_to_delete:
                 try:
                     # Unlink from scene if it's a root collection
-                    scene = context.scene
                     if scene.collection.children.find(coll.name) != -1:
                         scene.collection.children.unlink(coll)
                     
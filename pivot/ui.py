@@ -15,7 +15,6 @@
 # You should have received a copy of the GNU General Public License
 # along with this program; if not, see <https://www.gnu.org/licenses>.
 
-from re import S
 import bpy
 from .operators.operators import (
     Pivot_OT_Organize_Classified_Objects,
@@ -34,6 +33,29 @@ from .classes import LABEL_OBJECTS_COLLECTION, LABEL_ORIGIN_METHOD, LABEL_SURFAC
 from pivot_lib.engine_state import get_engine_license_status, set_engine_license_status
 import elbo_sdk_rust as engine
 
+# Operator ids and icons read by draw() on every redraw
+_IDN_STANDARDIZE = Pivot_OT_Standardize_Selected_Groups.bl_idname
+_IDN_ORGANIZE = Pivot_OT_Organize_Classified_Objects.bl_idname
+_IDN_RESET = Pivot_OT_Reset_Classifications.bl_idname
+_IDN_UPGRADE = Pivot_OT_Upgrade_To_Pro.bl_idname
+_IDN_SET_ORIGIN = Pivot_OT_Set_Origin_Selected_Objects.bl_idname
+_IDN_ALIGN_FACING = Pivot_OT_Align_Facing_Selected_Objects.bl_idname
+_ICON_SET_ORIGIN = Pivot_OT_Set_Origin_Selected_Objects.bl_icon
+_ICON_ALIGN_FACING = Pivot_OT_Align_Facing_Selected_Objects.bl_icon
+
+
+def _get_license_status():
+    """Return the cached engine license status, syncing it from the engine while still unknown."""
+    license_type = get_engine_license_status()
+    if license_type == "UNKNOWN":
+        try:
+            license_type = engine.get_license_command()
+            set_engine_license_status(license_type)
+        except Exception as e:
+            print(f"[Pivot] Failed to sync license: {e}")
+            license_type = "UNKNOWN"
+    return license_type
+
 
 class Pivot_PT_Status_Panel(bpy.types.Panel):
     bl_label = "Pivot Status"
@@ -46,23 +68,14 @@ class Pivot_PT_Status_Panel(bpy.types.Panel):
     def draw(self, context):
         layout = self.layout
         
-        # Get license_type from cached engine status, sync if needed
-        license_type = get_engine_license_status()
-        if license_type == "UNKNOWN":
-            try:
-                license_type = engine.get_license_command()
-                set_engine_license_status(license_type)
-            except Exception as e:
-                print(f"[Pivot] Failed to sync license: {e}")
-                license_type = "UNKNOWN"
+        license_type = _get_license_status()
         
         # Show license selector
         self._draw_license_selector(layout, license_type)
     
     def _draw_license_selector(self, layout, license_type):
         """Draw the license type display (read-only)."""
-        row = layout.row()
-        row.label(text=f"License: {license_type}")
+        layout.label(text=f"License: {license_type}")
 
 class Pivot_PT_Configuration_Panel(bpy.types.Panel):
     bl_label = "Pivot Configuration"
@@ -73,16 +86,13 @@ class Pivot_PT_Configuration_Panel(bpy.types.Panel):
 
     def draw(self, context):
         layout = self.layout
+        pivot = context.scene.pivot
 
         # Objects Collection selector
-        row = layout.row()
-        row.label(text=LABEL_SURFACE_TYPE)
-        row = layout.row()
-        row.prop(bpy.context.scene.pivot, "surface_type", expand=True)
-        row = layout.row()
-        row.label(text=LABEL_ORIGIN_METHOD)
-        row = layout.row()
-        row.prop(bpy.context.scene.pivot, "origin_method", expand=True)
+        layout.label(text=LABEL_SURFACE_TYPE)
+        layout.row().prop(pivot, "surface_type", expand=True)
+        layout.label(text=LABEL_ORIGIN_METHOD)
+        layout.row().prop(pivot, "origin_method", expand=True)
 
 
 class Pivot_PT_Pro_Panel(bpy.types.Panel):
@@ -100,35 +110,23 @@ class Pivot_PT_Pro_Panel(bpy.types.Panel):
     def draw(self, context):
         layout = self.layout
         
-        # Get license_type from cached engine status, sync if needed
-        license_type = get_engine_license_status()
-        if license_type == "UNKNOWN":
-            try:
-                license_type = engine.get_license_command()
-                set_engine_license_status(license_type)
-            except Exception as e:
-                print(f"[Pivot] Failed to sync license: {e}")
-                license_type = "UNKNOWN"
+        license_type = _get_license_status()
         
         enabled = (license_type == LICENSE_PRO)
         
         if enabled:
-            row = layout.row()
-            row.label(text=LABEL_OBJECTS_COLLECTION)
-            row = layout.row()
-            row.prop(bpy.context.scene.pivot, "objects_collection", text="")
+            layout.label(text=LABEL_OBJECTS_COLLECTION)
+            layout.prop(context.scene.pivot, "objects_collection", text="")
             layout.separator()
-            row = layout.row()
-            row.operator(Pivot_OT_Standardize_Selected_Groups.bl_idname)
+            layout_op = layout.operator
+            layout_op(_IDN_STANDARDIZE)
             
             # Organization button
-            row = layout.row()
-            row.operator(Pivot_OT_Organize_Classified_Objects.bl_idname)
+            layout_op(_IDN_ORGANIZE)
             
             # Reset classifications button
             layout.separator()
-            row = layout.row()
-            row.operator(Pivot_OT_Reset_Classifications.bl_idname, icon='X')
+            layout_op(_IDN_RESET, icon='X')
         else:
             # Standard mode: show upgrade info
             layout.label(text="Unlock Your Full Pipeline:")
@@ -136,8 +134,7 @@ class Pivot_PT_Pro_Panel(bpy.types.Panel):
             layout.label(text="- Auto-classify your entire scene")
             layout.label(text="- Multithreaded C++ performance")
             layout.separator()
-            row = layout.row()
-            row.operator(Pivot_OT_Upgrade_To_Pro.bl_idname, icon='WORLD')
+            layout.operator(_IDN_UPGRADE, icon='WORLD')
 
 
 class Pivot_PT_Standard_Panel(bpy.types.Panel):
@@ -148,15 +145,12 @@ class Pivot_PT_Standard_Panel(bpy.types.Panel):
     bl_category = CATEGORY  # Tab name in the N-Panel
 
     def draw(self, context):
-        obj = context.active_object
         layout = self.layout
         
         # Get license_type from cached engine status
         layout.label(text="On Selected Objects:")
         # Always show selected objects operators
         
-        row = layout.row()
-        row.operator(Pivot_OT_Set_Origin_Selected_Objects.bl_idname, icon=Pivot_OT_Set_Origin_Selected_Objects.bl_icon)
-        row = layout.row()
-        row.operator(Pivot_OT_Align_Facing_Selected_Objects.bl_idname, icon=Pivot_OT_Align_Facing_Selected_Objects.bl_icon)
+        layout.operator(_IDN_SET_ORIGIN, icon=_ICON_SET_ORIGIN)
+        layout.operator(_IDN_ALIGN_FACING, icon=_ICON_ALIGN_FACING)
 